@@ -0,0 +1,175 @@
+"""
+On-disk cache of processed e-commerce data for the analysis and debug scripts.
+
+Each script loads the same datasets and builds the same metrics report; caching
+the processed loader and the report lets repeat runs unpickle a snapshot instead
+of re-reading the CSV files and recomputing the metrics.
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import business_metrics
+import data_loader
+from business_metrics import BusinessMetricsCalculator
+from data_loader import EcommerceDataLoader, load_and_process_data
+
+# Default snapshot directory, overridden by the ECOM_CACHE_DIR environment variable
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ecom')
+
+# Pickles of pandas/numpy objects are tied to the library versions that wrote them
+LIBRARY_VERSIONS = f"pandas={pd.__version__}:numpy={np.__version__}:pyarrow={pa.__version__}\n"
+
+
+def _cache_dir() -> str:
+    """Directory snapshots are read from and written to."""
+    return os.environ.get('ECOM_CACHE_DIR', CACHE_DIR)
+
+
+def _update_file_digest(digest: Any, path: str) -> None:
+    """Add a file's path, modification time and size to a running digest."""
+    stat = os.stat(path)
+    digest.update(f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+
+
+def _load_snapshot(cache_path: str) -> Optional[Any]:
+    """Unpickle a cached object, or return None if it is missing or unreadable."""
+    if not os.path.exists(cache_path):
+        return None
+    # Any failure (truncated file, objects from another library version) is a cache miss
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _save_snapshot(cache_path: str, obj: Any) -> None:
+    """Pickle an object to the cache, best effort."""
+    # Write to a temporary file first so concurrent runs never read a partial snapshot
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _remove_stale_snapshots(pattern: str, keep_prefix: str) -> None:
+    """Delete cached snapshots matching a glob pattern unless their name starts with keep_prefix."""
+    for path in glob.glob(os.path.join(_cache_dir(), pattern)):
+        if not os.path.basename(path).startswith(keep_prefix):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _cache_key(data_path: str) -> str:
+    """
+    Fingerprint the data files, loader code and library versions a snapshot was built from.
+
+    Args:
+        data_path (str): Path to directory containing CSV files
+
+    Returns:
+        str: Hex digest that changes whenever any input file changes
+    """
+    sources = sorted(glob.glob(os.path.join(data_path, '*.csv'))
+                     + glob.glob(os.path.join(data_path, 'parquet', '*.parquet')))
+    sources.append(data_loader.__file__)
+
+    digest = hashlib.sha1(LIBRARY_VERSIONS.encode())
+    for source in sources:
+        _update_file_digest(digest, source)
+    return digest.hexdigest()
+
+
+def cached_load(data_path: str = 'ecommerce_data/') -> Tuple[EcommerceDataLoader, Dict[str, pd.DataFrame]]:
+    """
+    Load and process all e-commerce data, reusing a snapshot from earlier runs.
+    
+    Writing a new snapshot deletes older snapshots of the same data directory,
+    since they were built from data or code that has since changed.
+
+    Args:
+        data_path (str): Path to directory containing CSV files
+
+    Returns:
+        Tuple[EcommerceDataLoader, Dict[str, pd.DataFrame]]: Loader instance and processed data
+    """
+    # Snapshots of one data directory share a prefix, so pruning leaves other directories alone
+    path_key = hashlib.sha1(os.path.abspath(data_path).encode()).hexdigest()[:16]
+    key = _cache_key(data_path)
+    cache_path = os.path.join(_cache_dir(), f"loader-{path_key}-{key}.pkl")
+
+    snapshot = _load_snapshot(cache_path)
+    if snapshot is not None:
+        return snapshot
+
+    loader, processed_data = load_and_process_data(data_path)
+    _save_snapshot(cache_path, (loader, processed_data))
+    _remove_stale_snapshots(f"loader-{path_key}-*.pkl", keep_prefix=f"loader-{path_key}-{key}")
+    return loader, processed_data
+
+
+def cached_report(sales_data: pd.DataFrame,
+                  current_year: int,
+                  previous_year: Optional[int] = None,
+                  products_df: Optional[pd.DataFrame] = None,
+                  customers_df: Optional[pd.DataFrame] = None,
+                  reviews_df: Optional[pd.DataFrame] = None) -> Dict:
+    """
+    Generate the comprehensive metrics report, reusing one saved by an earlier run.
+
+    The report is keyed on the content of every input frame, the years, the
+    business_metrics code and the library versions, so any change to them produces
+    a fresh report. Reports left over from older code or libraries are deleted.
+
+    Args:
+        sales_data (pd.DataFrame): Sales dataset to analyze
+        current_year (int): Year to analyze
+        previous_year (Optional[int]): Previous year for comparison
+        products_df (Optional[pd.DataFrame]): Products dataset
+        customers_df (Optional[pd.DataFrame]): Customers dataset
+        reviews_df (Optional[pd.DataFrame]): Reviews dataset
+
+    Returns:
+        Dict: Report as returned by BusinessMetricsCalculator.generate_comprehensive_report
+    """
+    code_digest = hashlib.sha1(LIBRARY_VERSIONS.encode())
+    _update_file_digest(code_digest, business_metrics.__file__)
+    code_key = code_digest.hexdigest()[:16]
+    
+    digest = hashlib.sha1(f"report:{current_year}:{previous_year}\n".encode())
+    for df in (sales_data, products_df, customers_df, reviews_df):
+        if df is None:
+            digest.update(b"none\n")
+        else:
+            digest.update(",".join(f"{col}:{dtype}" for col, dtype in df.dtypes.items()).encode())
+            digest.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+    cache_path = os.path.join(_cache_dir(), f"report-{code_key}-{digest.hexdigest()}.pkl")
+
+    report = _load_snapshot(cache_path)
+    if report is not None:
+        return report
+
+    report = BusinessMetricsCalculator(sales_data).generate_comprehensive_report(
+        current_year=current_year,
+        previous_year=previous_year,
+        products_df=products_df,
+        customers_df=customers_df,
+        reviews_df=reviews_df
+    )
+    _save_snapshot(cache_path, report)
+    _remove_stale_snapshots('report-*.pkl', keep_prefix=f"report-{code_key}-")
+    return report
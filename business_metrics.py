@@ -7,13 +7,42 @@ revenue analysis, product performance, geographic insights, and customer satisfa
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List, Tuple, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Optional, Union
 from datetime import datetime
 
+# Plotting libraries are imported by MetricsVisualizer when it draws, so the
+# metrics calculator can be used without paying for their import
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
+
+
+def _distinct_counts_per_group(group_codes: np.ndarray, value_codes: np.ndarray,
+                               n_groups: int) -> np.ndarray:
+    """
+    Count distinct values within each group, given non-negative integer codes.
+    
+    Sorts the (group, value) pairs once and counts the first row of every
+    distinct pair, which avoids building a hash set per group.
+    
+    Args:
+        group_codes (np.ndarray): Group code for each row, in [0, n_groups)
+        value_codes (np.ndarray): Value code for each row
+        n_groups (int): Number of groups
+        
+    Returns:
+        np.ndarray: Number of distinct values per group code
+    """
+    order = np.lexsort((value_codes, group_codes))
+    groups = group_codes[order]
+    values = value_codes[order]
+    
+    first = np.ones(len(order), dtype=bool)
+    np.not_equal(groups[1:], groups[:-1], out=first[1:])
+    first[1:] |= values[1:] != values[:-1]
+    
+    return np.bincount(groups[first], minlength=n_groups)
+
 
 class BusinessMetricsCalculator:
     """
@@ -28,11 +57,59 @@ class BusinessMetricsCalculator:
         Initialize the metrics calculator with sales data.
         
         Args:
-            sales_data (pd.DataFrame): Processed sales dataset from data_loader
+            sales_data (pd.DataFrame): Processed sales dataset from data_loader.
+                The frame is treated as read-only and is only copied when some of
+                its columns need downcasting.
         """
-        self.sales_data = sales_data.copy()
+        # Compact dtypes for the integer-valued columns the aggregations scan.
+        # price stays float64 since float32 cannot hold revenue totals to the cent
+        downcast = {
+            col: dtype for col, dtype in
+            {'order_year': np.int16, 'order_month': np.int8, 'delivery_days': 'Int16'}.items()
+            if col in sales_data.columns and sales_data[col].dtype != dtype
+        }
+        self.sales_data = sales_data.astype(downcast) if downcast else sales_data
         self.metrics_cache = {}
         
+        # Yearly and (year, month) aggregates computed once, so revenue metrics
+        # for any pair of years are lookups rather than scans of the sales data
+        self._yearly = self.sales_data.groupby('order_year', observed=True).agg(
+            revenue=('price', 'sum'),
+            orders=('order_id', 'nunique'),
+            items=('order_id', 'size')
+        )
+        self._monthly = self.sales_data.groupby(['order_year', 'order_month'], observed=True)['price'].sum()
+        
+        # Merged frames keyed by (dataset name, id(input frame)); the input frame is
+        # kept alongside the result so a recycled id() never returns a stale merge
+        self._merge_cache = {}
+        # Input frames the cached metrics in metrics_cache were computed from
+        self._metrics_inputs = {}
+        
+    def _cached_merge(self, name: str, right_df: pd.DataFrame,
+                      build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the merge of sales data with right_df, building it on first use."""
+        key = (name, id(right_df))
+        cached = self._merge_cache.get(key)
+        if cached is not None and cached[0] is right_df:
+            return cached[1]
+        
+        merged = build()
+        self._merge_cache[key] = (right_df, merged)
+        return merged
+        
+    def _is_cached(self, key: str, source: pd.DataFrame) -> bool:
+        """Check whether metrics_cache[key] was computed from this exact frame."""
+        return key in self.metrics_cache and self._metrics_inputs.get(key) is source
+        
+    def _year_totals(self, year: int) -> Tuple[float, int, int]:
+        """Return (revenue, orders, items) for a year, all zero if it has no sales."""
+        if year not in self._yearly.index:
+            return np.float64(0.0), 0, 0
+        return (self._yearly.at[year, 'revenue'],
+                int(self._yearly.at[year, 'orders']),
+                int(self._yearly.at[year, 'items']))
+        
     def calculate_revenue_metrics(self, current_year: int, previous_year: Optional[int] = None) -> Dict:
         """
         Calculate comprehensive revenue metrics.
@@ -44,25 +121,27 @@ class BusinessMetricsCalculator:
         Returns:
             Dict: Revenue metrics including total revenue, growth, AOV, etc.
         """
-        current_data = self.sales_data[self.sales_data['order_year'] == current_year]
+        total_revenue, total_orders, total_items = self._year_totals(current_year)
+        # Month-indexed Series in month order, consumed directly by the plots
+        monthly_revenue = (self._monthly.loc[current_year] if total_items
+                           else pd.Series(dtype=np.float64, index=pd.Index([], name='order_month'), name='price'))
         
+        # AOV is revenue per order, so no per-order groupby is needed
         metrics = {
             'current_year': current_year,
-            'total_revenue': current_data['price'].sum(),
-            'total_orders': current_data['order_id'].nunique(),
-            'total_items': len(current_data),
-            'average_order_value': current_data.groupby('order_id')['price'].sum().mean(),
-            'average_item_price': current_data['price'].mean(),
-            'monthly_revenue': current_data.groupby('order_month')['price'].sum().to_dict()
+            'total_revenue': total_revenue,
+            'total_orders': total_orders,
+            'total_items': total_items,
+            'average_order_value': total_revenue / total_orders if total_orders else np.nan,
+            'average_item_price': total_revenue / total_items if total_items else np.nan,
+            'monthly_revenue': monthly_revenue
         }
         
         # Add growth metrics if previous year provided
         if previous_year:
-            previous_data = self.sales_data[self.sales_data['order_year'] == previous_year]
-            if not previous_data.empty:
-                prev_revenue = previous_data['price'].sum()
-                prev_orders = previous_data['order_id'].nunique()
-                prev_aov = previous_data.groupby('order_id')['price'].sum().mean()
+            prev_revenue, prev_orders, prev_items = self._year_totals(previous_year)
+            if prev_items:
+                prev_aov = prev_revenue / prev_orders
                 
                 metrics.update({
                     'previous_year': previous_year,
@@ -74,12 +153,15 @@ class BusinessMetricsCalculator:
                     'aov_growth_rate': ((metrics['average_order_value'] - prev_aov) / prev_aov) * 100
                 })
         
-        # Calculate monthly growth trend
-        monthly_revenue_series = pd.Series(metrics['monthly_revenue']).sort_index()
-        monthly_growth = monthly_revenue_series.pct_change().mean() * 100
-        metrics['monthly_growth_trend'] = monthly_growth
+        # Calculate monthly growth trend as the mean month-over-month change
+        monthly_values = monthly_revenue.to_numpy(dtype=np.float64)
+        metrics['monthly_growth_trend'] = (
+            float(np.mean(np.diff(monthly_values) / monthly_values[:-1]) * 100)
+            if monthly_values.size > 1 else np.nan
+        )
         
         self.metrics_cache['revenue'] = metrics
+        self._metrics_inputs['revenue'] = (current_year, previous_year)
         return metrics
     
     def calculate_product_metrics(self, products_df: pd.DataFrame) -> Dict:
@@ -92,36 +174,42 @@ class BusinessMetricsCalculator:
         Returns:
             Dict: Product performance metrics by category
         """
-        # Merge sales data with product categories
-        sales_with_categories = pd.merge(
-            self.sales_data,
-            products_df,
-            on='product_id',
-            how='left'
-        )
+        # Merge only the needed columns of sales data and product categories; the
+        # low-cardinality group key is categorical so the groupby works on int codes
+        sales_with_categories = self._cached_merge('products', products_df, lambda: pd.merge(
+            self.sales_data[['order_id', 'product_id', 'price']],
+            products_df[['product_id', 'product_category_name']]
+                .astype({'product_category_name': 'category'}).set_index('product_id'),
+            left_on='product_id',
+            right_index=True,
+            how='left',
+            copy=False
+        ))
         
         # Calculate category metrics
-        category_metrics = sales_with_categories.groupby('product_category_name').agg({
-            'price': ['sum', 'mean', 'count'],
-            'order_id': 'nunique',
-            'product_id': 'nunique'
-        }).round(2)
+        category_metrics = sales_with_categories.groupby('product_category_name', observed=True, sort=False).agg(
+            total_revenue=('price', 'sum'),
+            avg_item_price=('price', 'mean'),
+            total_items=('price', 'count'),
+            total_orders=('order_id', 'nunique'),
+            unique_products=('product_id', 'nunique')
+        )
         
-        category_metrics.columns = ['total_revenue', 'avg_item_price', 'total_items', 'total_orders', 'unique_products']
         category_metrics = category_metrics.sort_values('total_revenue', ascending=False)
         
-        # Calculate market share
-        total_revenue = category_metrics['total_revenue'].sum()
-        category_metrics['revenue_share_pct'] = (category_metrics['total_revenue'] / total_revenue * 100).round(2)
+        # Calculate market share on the underlying arrays
+        category_revenue = category_metrics['total_revenue'].to_numpy()
+        revenue_share = category_revenue / category_revenue.sum() * 100
+        category_metrics['revenue_share_pct'] = revenue_share
         
         metrics = {
             'category_performance': category_metrics,
-            'top_categories': category_metrics.head(10),
             'total_categories': len(category_metrics),
-            'revenue_concentration': category_metrics['revenue_share_pct'].head(5).sum()
+            'revenue_concentration': revenue_share[:5].sum()
         }
         
         self.metrics_cache['products'] = metrics
+        self._metrics_inputs['products'] = products_df
         return metrics
     
     def calculate_geographic_metrics(self, customers_df: pd.DataFrame) -> Dict:
@@ -134,39 +222,57 @@ class BusinessMetricsCalculator:
         Returns:
             Dict: Geographic performance metrics by state
         """
-        # Merge sales data with customer geography
-        sales_with_geography = pd.merge(
-            self.sales_data[['order_id', 'customer_id', 'price']].drop_duplicates(),
-            customers_df,
-            on='customer_id',
-            how='left'
+        # Aggregate to one row per order before merging with customer geography;
+        # de-duplicating (order, customer, price) rows would drop distinct items
+        # that happen to share a price
+        sales_with_geography = self._cached_merge('customers', customers_df, lambda: pd.merge(
+            self.sales_data.groupby('order_id', sort=False).agg(
+                price=('price', 'sum'),
+                customer_id=('customer_id', 'first')
+            ),
+            customers_df[['customer_id', 'customer_state']]
+                .astype({'customer_state': 'category'}).set_index('customer_id'),
+            left_on='customer_id',
+            right_index=True,
+            how='left',
+            copy=False
+        ))
+        
+        # Calculate state-level metrics; rows are orders, so order counts are group
+        # sizes, and distinct customers per state are counted on integer codes
+        # instead of per-group nunique hashing
+        state_codes = sales_with_geography['customer_state'].cat.codes.to_numpy()
+        known_state = state_codes >= 0
+        customers_per_state = _distinct_counts_per_group(
+            state_codes[known_state],
+            pd.factorize(sales_with_geography['customer_id'])[0][known_state],
+            len(sales_with_geography['customer_state'].cat.categories)
         )
         
-        # Calculate state-level metrics
-        state_metrics = sales_with_geography.groupby('customer_state').agg({
-            'price': 'sum',
-            'order_id': 'nunique',
-            'customer_id': 'nunique'
-        }).round(2)
+        state_metrics = sales_with_geography.groupby('customer_state', observed=True, sort=False).agg(
+            total_revenue=('price', 'sum'),
+            total_orders=('price', 'size')
+        )
+        state_metrics['unique_customers'] = customers_per_state[state_metrics.index.codes]
         
-        state_metrics.columns = ['total_revenue', 'total_orders', 'unique_customers']
         state_metrics = state_metrics.sort_values('total_revenue', ascending=False)
         
-        # Calculate additional metrics
-        state_metrics['avg_order_value'] = (state_metrics['total_revenue'] / state_metrics['total_orders']).round(2)
-        state_metrics['revenue_per_customer'] = (state_metrics['total_revenue'] / state_metrics['unique_customers']).round(2)
+        # Calculate additional metrics on the underlying arrays
+        state_revenue = state_metrics['total_revenue'].to_numpy()
+        state_metrics['avg_order_value'] = state_revenue / state_metrics['total_orders'].to_numpy()
+        state_metrics['revenue_per_customer'] = state_revenue / state_metrics['unique_customers'].to_numpy()
         
-        total_revenue = state_metrics['total_revenue'].sum()
-        state_metrics['revenue_share_pct'] = (state_metrics['total_revenue'] / total_revenue * 100).round(2)
+        revenue_share = state_revenue / state_revenue.sum() * 100
+        state_metrics['revenue_share_pct'] = revenue_share
         
         metrics = {
             'state_performance': state_metrics,
-            'top_states': state_metrics.head(10),
             'total_states': len(state_metrics),
-            'geographic_concentration': state_metrics['revenue_share_pct'].head(10).sum()
+            'geographic_concentration': revenue_share[:10].sum()
         }
         
         self.metrics_cache['geography'] = metrics
+        self._metrics_inputs['geography'] = customers_df
         return metrics
     
     def calculate_customer_satisfaction_metrics(self, reviews_df: pd.DataFrame) -> Dict:
@@ -179,55 +285,76 @@ class BusinessMetricsCalculator:
         Returns:
             Dict: Customer satisfaction and delivery performance metrics
         """
-        # Merge sales data with reviews
-        sales_with_reviews = pd.merge(
-            self.sales_data,
-            reviews_df,
-            on='order_id',
-            how='left'
+        # Reduce both sides to one row per order before joining, so the merge
+        # output is already order-level and needs no further de-duplication
+        order_level_data = self._cached_merge('reviews', reviews_df, lambda: pd.merge(
+            self.sales_data[['order_id', 'delivery_days']].drop_duplicates('order_id'),
+            reviews_df[['order_id', 'review_score']].drop_duplicates('order_id').set_index('order_id'),
+            left_on='order_id',
+            right_index=True,
+            how='left',
+            copy=False
+        ))
+        
+        # Read each order-level column into an ndarray once and derive every
+        # statistic from it; rates keep all orders in the denominator
+        scores = order_level_data['review_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+        days = order_level_data['delivery_days'].to_numpy(dtype=np.float64, na_value=np.nan)
+        has_score = ~np.isnan(scores)
+        valid_scores = scores[has_score]
+        valid_days = days[~np.isnan(days)]
+        
+        # Scores are integers 1-5, so the distribution is a bincount
+        score_counts = np.bincount(valid_scores.astype(np.int64), minlength=6)[1:6]
+        score_distribution = pd.Series(
+            score_counts / max(score_counts.sum(), 1),
+            index=pd.Index([1, 2, 3, 4, 5], name='review_score'),
+            name='proportion'
         )
         
-        # Remove duplicates for order-level analysis
-        order_level_data = sales_with_reviews[['order_id', 'delivery_days', 'review_score']].drop_duplicates()
-        
         # Calculate satisfaction metrics
         satisfaction_metrics = {
-            'average_review_score': order_level_data['review_score'].mean(),
-            'review_score_distribution': order_level_data['review_score'].value_counts(normalize=True).sort_index(),
-            'high_satisfaction_rate': (order_level_data['review_score'] >= 4).mean() * 100,
-            'low_satisfaction_rate': (order_level_data['review_score'] <= 2).mean() * 100
+            'average_review_score': valid_scores.mean() if valid_scores.size else np.nan,
+            'review_score_distribution': score_distribution,
+            'high_satisfaction_rate': (scores >= 4).mean() * 100 if scores.size else np.nan,
+            'low_satisfaction_rate': (scores <= 2).mean() * 100 if scores.size else np.nan
         }
         
         # Calculate delivery metrics
         delivery_metrics = {
-            'average_delivery_days': order_level_data['delivery_days'].mean(),
-            'median_delivery_days': order_level_data['delivery_days'].median(),
-            'fast_delivery_rate': (order_level_data['delivery_days'] <= 3).mean() * 100,
-            'slow_delivery_rate': (order_level_data['delivery_days'] > 10).mean() * 100
+            'average_delivery_days': valid_days.mean() if valid_days.size else np.nan,
+            'median_delivery_days': np.median(valid_days) if valid_days.size else np.nan,
+            'fast_delivery_rate': (days <= 3).mean() * 100 if days.size else np.nan,
+            'slow_delivery_rate': (days > 10).mean() * 100 if days.size else np.nan
         }
         
-        # Analyze delivery speed vs satisfaction
-        def categorize_delivery_speed(days):
-            if pd.isna(days):
-                return 'Unknown'
-            elif days <= 3:
-                return '1-3 days'
-            elif days <= 7:
-                return '4-7 days'
-            else:
-                return '8+ days'
-        
-        order_level_data['delivery_category'] = order_level_data['delivery_days'].apply(categorize_delivery_speed)
-        delivery_satisfaction = order_level_data.groupby('delivery_category')['review_score'].mean()
+        # Analyze delivery speed vs satisfaction: bucket delivery days into
+        # 1-3 / 4-7 / 8+ in one vectorized pass, with missing days as 'Unknown'
+        bucket_codes = np.searchsorted(np.array([3, 7, np.inf]), days, side='left')
+        bucket_codes = np.where(np.isnan(days), 3, bucket_codes)
+        
+        # Mean review score per bucket from weighted bincounts over the same
+        # codes, skipping orders without a review as the groupby mean did
+        bucket_labels = ['1-3 days', '4-7 days', '8+ days', 'Unknown']
+        bucket_orders = np.bincount(bucket_codes, minlength=4)
+        bucket_reviews = np.bincount(bucket_codes[has_score], minlength=4)
+        bucket_score_sums = np.bincount(bucket_codes[has_score], weights=valid_scores, minlength=4)
+        bucket_means = np.divide(bucket_score_sums, bucket_reviews,
+                                 out=np.full(4, np.nan), where=bucket_reviews > 0)
+        delivery_satisfaction = {
+            label: bucket_means[code]
+            for code, label in enumerate(bucket_labels) if bucket_orders[code]
+        }
         
         metrics = {
             'satisfaction': satisfaction_metrics,
             'delivery': delivery_metrics,
-            'delivery_satisfaction_correlation': delivery_satisfaction.to_dict(),
-            'total_reviews': len(order_level_data.dropna(subset=['review_score']))
+            'delivery_satisfaction_correlation': delivery_satisfaction,
+            'total_reviews': valid_scores.size
         }
         
         self.metrics_cache['customer_experience'] = metrics
+        self._metrics_inputs['customer_experience'] = reviews_df
         return metrics
     
     def generate_comprehensive_report(self, 
@@ -257,21 +384,33 @@ class BusinessMetricsCalculator:
                     'start': self.sales_data['order_purchase_timestamp'].min(),
                     'end': self.sales_data['order_purchase_timestamp'].max()
                 },
-                'years_available': sorted(self.sales_data['order_year'].unique())
+                'years_available': self._yearly.index.tolist()
             }
         }
         
-        # Calculate all metrics
-        report['revenue_metrics'] = self.calculate_revenue_metrics(current_year, previous_year)
+        # Calculate all metrics, reusing cached results computed from the same inputs
+        if self._metrics_inputs.get('revenue') == (current_year, previous_year):
+            report['revenue_metrics'] = self.metrics_cache['revenue']
+        else:
+            report['revenue_metrics'] = self.calculate_revenue_metrics(current_year, previous_year)
         
         if products_df is not None:
-            report['product_metrics'] = self.calculate_product_metrics(products_df)
+            report['product_metrics'] = (
+                self.metrics_cache['products'] if self._is_cached('products', products_df)
+                else self.calculate_product_metrics(products_df)
+            )
             
         if customers_df is not None:
-            report['geographic_metrics'] = self.calculate_geographic_metrics(customers_df)
+            report['geographic_metrics'] = (
+                self.metrics_cache['geography'] if self._is_cached('geography', customers_df)
+                else self.calculate_geographic_metrics(customers_df)
+            )
             
         if reviews_df is not None:
-            report['customer_experience_metrics'] = self.calculate_customer_satisfaction_metrics(reviews_df)
+            report['customer_experience_metrics'] = (
+                self.metrics_cache['customer_experience'] if self._is_cached('customer_experience', reviews_df)
+                else self.calculate_customer_satisfaction_metrics(reviews_df)
+            )
         
         return report
     
@@ -282,39 +421,43 @@ class BusinessMetricsCalculator:
         Args:
             report (Dict): Comprehensive metrics report
         """
-        print("=" * 60)
-        print(f"BUSINESS METRICS SUMMARY - {report['revenue_metrics']['current_year']}")
-        print("=" * 60)
+        # Collect the report lines and write them in a single call
+        lines = []
+        lines.append("=" * 60)
+        lines.append(f"BUSINESS METRICS SUMMARY - {report['revenue_metrics']['current_year']}")
+        lines.append("=" * 60)
         
         # Revenue Performance
         revenue = report['revenue_metrics']
-        print(f"\nREVENUE PERFORMANCE:")
-        print(f"  Total Revenue: ${revenue['total_revenue']:,.2f}")
-        print(f"  Total Orders: {revenue['total_orders']:,}")
-        print(f"  Average Order Value: ${revenue['average_order_value']:.2f}")
+        lines.append(f"\nREVENUE PERFORMANCE:")
+        lines.append(f"  Total Revenue: ${revenue['total_revenue']:,.2f}")
+        lines.append(f"  Total Orders: {revenue['total_orders']:,}")
+        lines.append(f"  Average Order Value: ${revenue['average_order_value']:.2f}")
         
         if 'revenue_growth_rate' in revenue:
             growth_symbol = "+" if revenue['revenue_growth_rate'] >= 0 else ""
-            print(f"  Revenue Growth: {growth_symbol}{revenue['revenue_growth_rate']:.1f}%")
+            lines.append(f"  Revenue Growth: {growth_symbol}{revenue['revenue_growth_rate']:.1f}%")
         
         # Product Performance
         if 'product_metrics' in report:
             products = report['product_metrics']
-            print(f"\nPRODUCT PERFORMANCE:")
-            print(f"  Total Categories: {products['total_categories']}")
-            print(f"  Top 5 Revenue Concentration: {products['revenue_concentration']:.1f}%")
-            print(f"  Top Category: {products['top_categories'].index[0]}")
+            lines.append(f"\nPRODUCT PERFORMANCE:")
+            lines.append(f"  Total Categories: {products['total_categories']}")
+            lines.append(f"  Top 5 Revenue Concentration: {products['revenue_concentration']:.1f}%")
+            lines.append(f"  Top Category: {products['category_performance'].index[0]}")
         
         # Customer Satisfaction
         if 'customer_experience_metrics' in report:
             experience = report['customer_experience_metrics']
-            print(f"\nCUSTOMER SATISFACTION:")
-            print(f"  Average Review Score: {experience['satisfaction']['average_review_score']:.2f}/5.0")
-            print(f"  High Satisfaction (4+): {experience['satisfaction']['high_satisfaction_rate']:.1f}%")
+            lines.append(f"\nCUSTOMER SATISFACTION:")
+            lines.append(f"  Average Review Score: {experience['satisfaction']['average_review_score']:.2f}/5.0")
+            lines.append(f"  High Satisfaction (4+): {experience['satisfaction']['high_satisfaction_rate']:.1f}%")
             
-            print(f"\nDELIVERY PERFORMANCE:")
-            print(f"  Average Delivery Time: {experience['delivery']['average_delivery_days']:.1f} days")
-            print(f"  Fast Delivery (≤3 days): {experience['delivery']['fast_delivery_rate']:.1f}%")
+            lines.append(f"\nDELIVERY PERFORMANCE:")
+            lines.append(f"  Average Delivery Time: {experience['delivery']['average_delivery_days']:.1f} days")
+            lines.append(f"  Fast Delivery (≤3 days): {experience['delivery']['fast_delivery_rate']:.1f}%")
+
+        print("\n".join(lines))
 
 
 class MetricsVisualizer:
@@ -330,6 +473,9 @@ class MetricsVisualizer:
             report (Dict): Comprehensive metrics report
             color_palette (str): Color palette for visualizations
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         self.report = report
         self.color_palette = color_palette
         
@@ -337,7 +483,7 @@ class MetricsVisualizer:
         plt.style.use('default')
         sns.set_palette(color_palette)
         
-    def plot_revenue_trend(self, figsize: Tuple[int, int] = (12, 6)) -> plt.Figure:
+    def plot_revenue_trend(self, figsize: Tuple[int, int] = (12, 6)) -> 'plt.Figure':
         """
         Create a revenue trend visualization.
         
@@ -347,11 +493,13 @@ class MetricsVisualizer:
         Returns:
             plt.Figure: Revenue trend plot
         """
+        import matplotlib.pyplot as plt
+        
         revenue_data = self.report['revenue_metrics']['monthly_revenue']
         
         fig, ax = plt.subplots(figsize=figsize)
-        months = sorted(revenue_data.keys())
-        revenues = [revenue_data[month] for month in months]
+        months = revenue_data.index.to_numpy()
+        revenues = revenue_data.to_numpy()
         
         ax.plot(months, revenues, marker='o', linewidth=2, markersize=6)
         ax.fill_between(months, revenues, alpha=0.3)
@@ -368,7 +516,7 @@ class MetricsVisualizer:
         plt.tight_layout()
         return fig
     
-    def plot_category_performance(self, top_n: int = 10, figsize: Tuple[int, int] = (12, 8)) -> plt.Figure:
+    def plot_category_performance(self, top_n: int = 10, figsize: Tuple[int, int] = (12, 8)) -> 'plt.Figure':
         """
         Create a product category performance visualization.
         
@@ -382,6 +530,8 @@ class MetricsVisualizer:
         if 'product_metrics' not in self.report:
             raise ValueError("Product metrics not available in report")
             
+        import matplotlib.pyplot as plt
+        
         category_data = self.report['product_metrics']['category_performance'].head(top_n)
         
         fig, ax = plt.subplots(figsize=figsize)
@@ -407,7 +557,7 @@ class MetricsVisualizer:
         plt.tight_layout()
         return fig
     
-    def plot_geographic_distribution(self) -> go.Figure:
+    def plot_geographic_distribution(self) -> 'go.Figure':
         """
         Create an interactive geographic distribution map.
         
@@ -417,6 +567,8 @@ class MetricsVisualizer:
         if 'geographic_metrics' not in self.report:
             raise ValueError("Geographic metrics not available in report")
             
+        import plotly.express as px
+        
         state_data = self.report['geographic_metrics']['state_performance'].reset_index()
         
         fig = px.choropleth(
@@ -427,7 +579,7 @@ class MetricsVisualizer:
             scope='usa',
             title=f'Revenue by State - {self.report["revenue_metrics"]["current_year"]}',
             color_continuous_scale='Reds',
-            hover_data={'total_orders': True, 'avg_order_value': True}
+            hover_data={'total_orders': ':,', 'avg_order_value': ':$,.2f'}
         )
         
         fig.update_layout(
@@ -438,7 +590,7 @@ class MetricsVisualizer:
         
         return fig
     
-    def plot_satisfaction_distribution(self, figsize: Tuple[int, int] = (10, 6)) -> plt.Figure:
+    def plot_satisfaction_distribution(self, figsize: Tuple[int, int] = (10, 6)) -> 'plt.Figure':
         """
         Create a customer satisfaction distribution visualization.
         
@@ -451,6 +603,8 @@ class MetricsVisualizer:
         if 'customer_experience_metrics' not in self.report:
             raise ValueError("Customer experience metrics not available in report")
             
+        import matplotlib.pyplot as plt
+        
         satisfaction_data = self.report['customer_experience_metrics']['satisfaction']['review_score_distribution']
         
         fig, ax = plt.subplots(figsize=figsize)
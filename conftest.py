@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures for the dashboard and analysis test scripts.
+"""
+
+import os
+
+import pytest
+
+from _cache import cached_load
+
+
+@pytest.fixture(scope='session', autouse=True)
+def isolated_cache(tmp_path_factory):
+    """Keep snapshots in a fresh directory, so tests build the data and reports from current code"""
+    previous = os.environ.get('ECOM_CACHE_DIR')
+    os.environ['ECOM_CACHE_DIR'] = str(tmp_path_factory.mktemp('ecom-cache'))
+    yield
+    if previous is None:
+        os.environ.pop('ECOM_CACHE_DIR', None)
+    else:
+        os.environ['ECOM_CACHE_DIR'] = previous
+
+
+@pytest.fixture(scope='session')
+def loader(isolated_cache):
+    """Processed data loader, loaded once and shared by every test in the session"""
+    loader, _ = cached_load('ecommerce_data/')
+    return loader
@@ -20,6 +20,9 @@ from business_metrics import BusinessMetricsCalculator
 
 warnings.filterwarnings('ignore')
 
+# Star strings for rounded ratings 0-5
+STAR_TABLE = ["☆☆☆☆☆", "★☆☆☆☆", "★★☆☆☆", "★★★☆☆", "★★★★☆", "★★★★★"]
+
 # Page configuration
 st.set_page_config(
     page_title="E-commerce Analytics Dashboard",
@@ -104,9 +107,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@st.cache_resource
 def load_data():
-    """Load and cache the e-commerce data"""
+    """Load the e-commerce data once and share it across reruns"""
     try:
         loader, processed_data = load_and_process_data('ecommerce_data/')
         return loader, processed_data
@@ -114,6 +117,29 @@ def load_data():
         st.error(f"Error loading data: {e}")
         return None, None
 
+@st.cache_data(show_spinner=False)
+def build_sales_dataset(_loader, years_to_include, status_filter='delivered'):
+    """Create and cache the filtered sales dataset for a tuple of years"""
+    return _loader.create_sales_dataset(
+        year_filter=list(years_to_include),
+        status_filter=status_filter
+    )
+
+@st.cache_data(show_spinner=False)
+def build_report(_loader, current_year, previous_year, status_filter='delivered'):
+    """Calculate and cache the comprehensive metrics report for a year comparison"""
+    years_to_include = (current_year, previous_year) if previous_year else (current_year,)
+    sales_data = build_sales_dataset(_loader, years_to_include, status_filter)
+    
+    metrics_calculator = BusinessMetricsCalculator(sales_data)
+    return metrics_calculator.generate_comprehensive_report(
+        current_year=current_year,
+        previous_year=previous_year,
+        products_df=_loader.products_df,
+        customers_df=_loader.customers_df,
+        reviews_df=_loader.reviews_df
+    )
+
 def format_number(num, prefix="$"):
     """Format numbers for display (e.g., $300K, $2M)"""
     if num >= 1_000_000:
@@ -123,6 +149,19 @@ def format_number(num, prefix="$"):
     else:
         return f"{prefix}{num:.0f}"
 
+def format_number_vec(values, prefix="$"):
+    """Format an array of numbers like format_number, choosing tiers with array masks"""
+    values = np.asarray(values, dtype=np.float64)
+    millions = values >= 1_000_000
+    thousands = (values >= 1_000) & ~millions
+    units = ~(millions | thousands)
+    
+    formatted = np.empty(values.shape, dtype=object)
+    formatted[millions] = [f"{prefix}{v:.1f}M" for v in values[millions] / 1_000_000]
+    formatted[thousands] = [f"{prefix}{v:.0f}K" for v in values[thousands] / 1_000]
+    formatted[units] = [f"{prefix}{v:.0f}" for v in values[units]]
+    return formatted
+
 def format_percentage(num):
     """Format percentage with proper sign and color"""
     if num >= 0:
@@ -130,42 +169,48 @@ def format_percentage(num):
     else:
         return f"↓ {num:.2f}%", "trend-negative"
 
-def create_revenue_trend_chart(sales_data, current_year, previous_year):
+@st.cache_data(show_spinner=False)
+def create_revenue_trend_chart(monthly_revenue, current_year, previous_year):
     """Create revenue trend line chart with current and previous year comparison"""
     
-    # Current year data
-    current_data = sales_data[sales_data['order_year'] == current_year]
-    current_monthly = current_data.groupby('order_month')['price'].sum().reset_index()
-    current_monthly['formatted_revenue'] = current_monthly['price'].apply(lambda x: format_number(x))
+    # Precomputed monthly revenue, one column per year
+    monthly = (
+        monthly_revenue['revenue']
+        .unstack('order_year')
+        .reindex(columns=[current_year, previous_year])
+    )
+    current_monthly = monthly[current_year].dropna()
+    previous_monthly = monthly[previous_year].dropna()
     
-    # Previous year data
-    previous_data = sales_data[sales_data['order_year'] == previous_year]
-    previous_monthly = previous_data.groupby('order_month')['price'].sum().reset_index()
-    previous_monthly['formatted_revenue'] = previous_monthly['price'].apply(lambda x: format_number(x))
+    # Plain arrays skip plotly's pandas conversion
+    current_months = current_monthly.index.to_numpy()
+    current_values = current_monthly.to_numpy(dtype=np.float64)
+    previous_months = previous_monthly.index.to_numpy()
+    previous_values = previous_monthly.to_numpy(dtype=np.float64)
     
     fig = go.Figure()
     
-    # Current year line (solid)
-    fig.add_trace(go.Scatter(
-        x=current_monthly['order_month'],
-        y=current_monthly['price'],
+    # Current year line (solid), rendered with WebGL
+    fig.add_trace(go.Scattergl(
+        x=current_months,
+        y=current_values,
         mode='lines+markers',
         name=f'{current_year}',
         line=dict(color='#3b82f6', width=3),
         marker=dict(size=6),
-        customdata=current_monthly['formatted_revenue'],
+        customdata=format_number_vec(current_values),
         hovertemplate='Month: %{x}<br>Revenue: %{customdata}<extra></extra>'
     ))
     
     # Previous year line (dashed)
-    fig.add_trace(go.Scatter(
-        x=previous_monthly['order_month'],
-        y=previous_monthly['price'],
+    fig.add_trace(go.Scattergl(
+        x=previous_months,
+        y=previous_values,
         mode='lines+markers',
         name=f'{previous_year}',
         line=dict(color='#94a3b8', width=2, dash='dash'),
         marker=dict(size=4),
-        customdata=previous_monthly['formatted_revenue'],
+        customdata=format_number_vec(previous_values),
         hovertemplate='Month: %{x}<br>Revenue: %{customdata}<extra></extra>'
     ))
     
@@ -188,10 +233,11 @@ def create_revenue_trend_chart(sales_data, current_year, previous_year):
     
     return fig
 
-def create_category_chart(product_metrics):
+@st.cache_data(show_spinner=False)
+def create_category_chart(category_performance):
     """Create top 10 categories bar chart with blue gradient"""
     
-    top_10 = product_metrics['category_performance'].head(10)
+    top_10 = category_performance.head(10)
     
     # Create blue gradient colors (darker for higher values)
     colors = px.colors.sequential.Blues_r[:len(top_10)]
@@ -202,7 +248,7 @@ def create_category_chart(product_metrics):
             x=top_10['total_revenue'],
             orientation='h',
             marker=dict(color=colors),
-            customdata=[format_number(x) for x in top_10['total_revenue']],
+            customdata=format_number_vec(top_10['total_revenue'].values),
             hovertemplate='Category: %{y}<br>Revenue: %{customdata}<extra></extra>'
         )
     ])
@@ -219,10 +265,18 @@ def create_category_chart(product_metrics):
     
     return fig
 
-def create_choropleth_map(geographic_metrics):
+@st.cache_data(show_spinner=False)
+def create_choropleth_map(state_performance):
     """Create US choropleth map for revenue by state"""
     
-    state_data = geographic_metrics['state_performance'].reset_index()
+    state_data = state_performance.reset_index()
+    
+    # Hover labels formatted once here rather than per hover in the browser
+    state_data['hover_text'] = (
+        'Revenue: ' + format_number_vec(state_data['total_revenue'].values)
+        + '<br>Orders: ' + state_data['total_orders'].map('{:,}'.format).values
+        + '<br>AOV: ' + format_number_vec(state_data['avg_order_value'].values)
+    )
     
     fig = px.choropleth(
         state_data,
@@ -232,12 +286,9 @@ def create_choropleth_map(geographic_metrics):
         scope='usa',
         title='Revenue by State',
         color_continuous_scale='Blues',
-        hover_data={
-            'total_revenue': ':$,.0f',
-            'total_orders': ':,',
-            'avg_order_value': ':$,.0f'
-        }
+        custom_data=['hover_text']
     )
+    fig.update_traces(hovertemplate='%{location}<br>%{customdata[0]}<extra></extra>')
     
     fig.update_layout(
         height=400,
@@ -248,11 +299,10 @@ def create_choropleth_map(geographic_metrics):
     
     return fig
 
-def create_satisfaction_delivery_chart(experience_metrics):
+@st.cache_data(show_spinner=False)
+def create_satisfaction_delivery_chart(delivery_satisfaction):
     """Create satisfaction vs delivery time bar chart"""
     
-    delivery_satisfaction = experience_metrics['delivery_satisfaction_correlation']
-    
     # Order the categories properly
     categories = ['1-3 days', '4-7 days', '8+ days']
     values = [delivery_satisfaction.get(cat, 0) for cat in categories]
@@ -292,7 +342,7 @@ def main():
     with st.expander("Debug Info", expanded=False):
         st.write(f"Datasets loaded: {list(processed_data.keys())}")
         st.write(f"Orders shape: {processed_data['orders'].shape}")
-        st.write(f"Available years: {sorted(processed_data['orders']['order_year'].dropna().unique())}")
+        st.write(f"Available years: {loader.available_years}")
     
     # Header with title and date filter
     col1, col2 = st.columns([3, 1])
@@ -303,7 +353,7 @@ def main():
     
     with col2:
         # Get available years from data
-        available_years = sorted(processed_data['orders']['order_year'].dropna().unique())
+        available_years = loader.available_years
         current_year = st.selectbox(
             "Select Year",
             available_years,
@@ -315,33 +365,16 @@ def main():
     previous_year = current_year - 1 if current_year - 1 in available_years else None
     
     # Create filtered sales dataset
-    years_to_include = [current_year, previous_year] if previous_year else [current_year]
-    sales_data = loader.create_sales_dataset(
-        year_filter=years_to_include,
-        status_filter='delivered'
-    )
+    years_to_include = (current_year, previous_year) if previous_year else (current_year,)
+    sales_data = build_sales_dataset(loader, years_to_include, 'delivered')
     
     if sales_data.empty:
         st.warning(f"No data available for {current_year}")
         return
     
-    # Get supporting datasets
+    # Calculate metrics (cached per year comparison)
     try:
-        products_df = loader.get_product_categories()
-        customers_df = loader.get_customer_geography()
-        reviews_df = loader.get_review_scores()
-        
-        # Calculate metrics
-        metrics_calculator = BusinessMetricsCalculator(sales_data)
-        
-        # Generate comprehensive report
-        comprehensive_report = metrics_calculator.generate_comprehensive_report(
-            current_year=current_year,
-            previous_year=previous_year,
-            products_df=products_df,
-            customers_df=customers_df,
-            reviews_df=reviews_df
-        )
+        comprehensive_report = build_report(loader, current_year, previous_year)
         
     except Exception as e:
         st.error(f"Error generating metrics: {e}")
@@ -428,7 +461,9 @@ def main():
     with chart_row1_col1:
         try:
             if previous_year:
-                revenue_chart = create_revenue_trend_chart(sales_data, current_year, previous_year)
+                revenue_chart = create_revenue_trend_chart(
+                    loader.get_monthly_revenue('delivered'), current_year, previous_year
+                )
                 st.plotly_chart(revenue_chart, use_container_width=True)
             else:
                 st.info("Previous year data not available for trend comparison")
@@ -438,7 +473,7 @@ def main():
     with chart_row1_col2:
         try:
             if product_metrics and 'category_performance' in product_metrics:
-                category_chart = create_category_chart(product_metrics)
+                category_chart = create_category_chart(product_metrics['category_performance'])
                 st.plotly_chart(category_chart, use_container_width=True)
             else:
                 st.info("Product metrics not available")
@@ -450,7 +485,7 @@ def main():
     with chart_row2_col1:
         try:
             if geographic_metrics and 'state_performance' in geographic_metrics:
-                map_chart = create_choropleth_map(geographic_metrics)
+                map_chart = create_choropleth_map(geographic_metrics['state_performance'])
                 st.plotly_chart(map_chart, use_container_width=True)
             else:
                 st.info("Geographic metrics not available")
@@ -460,7 +495,9 @@ def main():
     with chart_row2_col2:
         try:
             if experience_metrics and 'delivery_satisfaction_correlation' in experience_metrics:
-                satisfaction_chart = create_satisfaction_delivery_chart(experience_metrics)
+                satisfaction_chart = create_satisfaction_delivery_chart(
+                    experience_metrics['delivery_satisfaction_correlation']
+                )
                 st.plotly_chart(satisfaction_chart, use_container_width=True)
             else:
                 st.info("Customer experience metrics not available")
@@ -495,7 +532,7 @@ def main():
         try:
             if experience_metrics and 'satisfaction' in experience_metrics:
                 avg_rating = experience_metrics['satisfaction']['average_review_score']
-                stars = "★" * int(round(avg_rating)) + "☆" * (5 - int(round(avg_rating)))
+                stars = STAR_TABLE[max(0, min(5, int(round(avg_rating))))]
                 
                 st.markdown(f"""
                 <div class="bottom-card">
@@ -511,8 +548,13 @@ def main():
     
     # Footer with data info
     st.markdown("---")
-    st.markdown(f"**Data Range:** {sales_data['order_purchase_timestamp'].min().strftime('%B %Y')} - "
-               f"{sales_data['order_purchase_timestamp'].max().strftime('%B %Y')} | "
+    # Date range from the precomputed monthly revenue of the selected years
+    data_months = loader.get_monthly_revenue('delivered').index
+    data_months = data_months[data_months.get_level_values('order_year').isin(years_to_include)]
+    first_month, last_month = (datetime(int(year), int(month), 1)
+                               for year, month in (data_months.min(), data_months.max()))
+    st.markdown(f"**Data Range:** {first_month.strftime('%B %Y')} - "
+               f"{last_month.strftime('%B %Y')} | "
                f"**Total Records:** {len(sales_data):,} | "
                f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
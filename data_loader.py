@@ -5,14 +5,123 @@ This module provides functions for loading, cleaning, and processing e-commerce
 including orders, products, customers, and reviews data.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional, Union
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from typing import Dict, List, Tuple, Optional, Union
 import warnings
 
 # Suppress pandas warnings for cleaner output
 warnings.filterwarnings('ignore', category=pd.errors.SettingWithCopyWarning)
 
+# Timestamp layouts found in the source CSV files, with and without microseconds
+TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S')
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of timestamp strings with explicit formats.
+    
+    The format is sniffed from the first non-null value so pandas can use its
+    vectorized parser. Values it leaves unparsed are retried with the other
+    known format, and anything still unparsed is inferred value by value.
+    
+    Args:
+        values (pd.Series): Timestamp strings, or an already parsed column
+        
+    Returns:
+        pd.Series: Parsed timestamps, NaT where a value cannot be parsed
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    non_null = values.dropna()
+    if non_null.empty:
+        return pd.to_datetime(values, errors='coerce')
+    
+    formats = (TIMESTAMP_FORMATS if '.' in str(non_null.iloc[0])
+               else TIMESTAMP_FORMATS[::-1])
+    parsed = pd.to_datetime(values, format=formats[0], errors='coerce', cache=True)
+    
+    # Mixed layouts: retry only the values the sniffed format missed
+    unparsed = parsed.isna() & values.notna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(values[unparsed], format=formats[1], errors='coerce')
+        unparsed = parsed.isna() & values.notna()
+        if unparsed.any():
+            parsed[unparsed] = values[unparsed].map(lambda v: pd.to_datetime(v, errors='coerce'))
+    return parsed
+
+
+def _read_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a CSV file with pyarrow's multithreaded parser.
+    
+    Timestamp columns in ISO layout are parsed by pyarrow as nanosecond
+    timestamps; anything it leaves as strings is handled by _parse_timestamps.
+    
+    Args:
+        path (str): Path of the CSV file
+        columns (List[str], optional): Columns to read, in this order; all if None
+        
+    Returns:
+        pd.DataFrame: NumPy-backed frame, empty strings read as missing values
+    """
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pa_csv.ConvertOptions(include_columns=columns or [], strings_can_be_null=True)
+    )
+    return table.to_pandas(self_destruct=True, coerce_temporal_nanoseconds=True)
+
+
+def _matches_any(values: np.ndarray, targets: List) -> np.ndarray:
+    """
+    Mask of values equal to any of a few targets.
+    
+    One vectorized comparison per target, ORed together; for the handful of
+    years or months a filter names this is far cheaper than np.isin, which
+    sorts or promotes the whole column first.
+    
+    Args:
+        values (np.ndarray): Column values
+        targets (List): Values to match
+        
+    Returns:
+        np.ndarray: Boolean mask, True where values is in targets
+    """
+    mask = np.zeros(values.shape, dtype=bool)
+    for target in targets:
+        mask |= values == target
+    return mask
+
+
+def _elapsed_days(end: pd.Series, start: pd.Series) -> pd.Series:
+    """
+    Whole days from start to end, computed on the int64 nanosecond values.
+    
+    Matches ``(end - start).dt.days`` without the timedelta intermediate.
+    
+    Args:
+        end (pd.Series): Later timestamps
+        start (pd.Series): Earlier timestamps
+        
+    Returns:
+        pd.Series: Nullable Int16 days, missing where either timestamp is NaT
+    """
+    end_ns = end.to_numpy(dtype='datetime64[ns]').view('i8')
+    start_ns = start.to_numpy(dtype='datetime64[ns]').view('i8')
+    missing = end.isna().to_numpy() | start.isna().to_numpy()
+    days = ((end_ns - start_ns) // NS_PER_DAY).astype(np.int16)
+    return pd.Series(pd.arrays.IntegerArray(days, missing), index=end.index)
+
 
 class EcommerceDataLoader:
     """
@@ -22,6 +131,48 @@ class EcommerceDataLoader:
     for creating analysis-ready datasets with proper data types and relationships.
     """
     
+    # Source CSV file for each dataset
+    DATASETS = {
+        'orders': 'orders_dataset.csv',
+        'order_items': 'order_items_dataset.csv',
+        'products': 'products_dataset.csv',
+        'customers': 'customers_dataset.csv',
+        'reviews': 'order_reviews_dataset.csv',
+        'payments': 'order_payments_dataset.csv'
+    }
+    
+    # Columns the analysis actually uses; only these are read, so unused columns
+    # (review text, product dimensions, ...) never reach memory
+    USED_COLUMNS = {
+        'orders': ['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp',
+                   'order_delivered_customer_date'],
+        'order_items': ['order_id', 'order_item_id', 'product_id', 'price', 'freight_value'],
+        'products': ['product_id', 'product_category_name'],
+        'customers': ['customer_id', 'customer_state', 'customer_city'],
+        'reviews': ['order_id', 'review_score', 'review_creation_date'],
+        'payments': ['order_id', 'payment_type', 'payment_value']
+    }
+    
+    # Timestamp columns stored as strings in the CSV files
+    DATETIME_COLUMNS = {
+        'orders': ['order_purchase_timestamp', 'order_approved_at',
+                   'order_delivered_carrier_date', 'order_delivered_customer_date',
+                   'order_estimated_delivery_date'],
+        'reviews': ['review_creation_date', 'review_answer_timestamp']
+    }
+    
+    # Columns of orders and order_items carried into the sales dataset
+    SALES_ORDER_COLUMNS = ['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp',
+                           'order_delivered_customer_date', 'order_year', 'order_month', 'delivery_days']
+    SALES_ITEM_COLUMNS = ['order_id', 'order_item_id', 'product_id', 'price', 'freight_value']
+    
+    # Low-cardinality string columns, loaded as categoricals and written to
+    # Parquet with dictionary encoding
+    CATEGORICAL_COLUMNS = ['order_status', 'customer_state', 'product_category_name']
+    
+    # Small-range integer columns, narrowed when they have no missing values
+    NARROW_INT_COLUMNS = {'review_score': np.int8}
+    
     def __init__(self, data_path: str = 'ecommerce_data/'):
         """
         Initialize the data loader with the path to data files.
@@ -32,69 +183,149 @@ class EcommerceDataLoader:
         self.data_path = data_path
         self.raw_data = {}
         self.processed_data = {}
+        self._orders_indexed = None
+        self._monthly_revenue = None
+        self.available_years = []
+        
+    def _parquet_path(self, name: str) -> str:
+        """Path of the Parquet copy of a dataset."""
+        return os.path.join(self.data_path, 'parquet', f"{name}.parquet")
+    
+    def convert_csv_to_parquet(self) -> List[str]:
+        """
+        Convert every CSV file to Parquet for faster, column-pruned loading.
+        
+        Timestamps are parsed once and stored as timestamps, and low-cardinality
+        string columns are dictionary encoded. load_raw_data uses a Parquet file
+        whenever it is at least as new as its CSV source.
+        
+        Returns:
+            List[str]: Paths of the written Parquet files
+        """
+        os.makedirs(os.path.join(self.data_path, 'parquet'), exist_ok=True)
+        written = []
+        
+        for name, filename in self.DATASETS.items():
+            df = _read_csv(f"{self.data_path}{filename}")
+            for col in self.DATETIME_COLUMNS.get(name, []):
+                if col in df.columns:
+                    df[col] = _parse_timestamps(df[col])
+            
+            path = self._parquet_path(name)
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                path,
+                use_dictionary=[col for col in self.CATEGORICAL_COLUMNS if col in df.columns]
+            )
+            written.append(path)
+            print(f"Converted {name} to {path}")
+            
+        return written
+    
+    def _read_dataset(self, name: str, filename: str) -> pd.DataFrame:
+        """
+        Read the used columns of a dataset, preferring an up-to-date Parquet copy.
+        
+        Low-cardinality string columns are returned as categoricals, so filters
+        and groupbys on them compare integer codes instead of Python strings,
+        and small-range integer columns are narrowed to their compact dtype.
+        """
+        csv_path = f"{self.data_path}{filename}"
+        parquet_path = self._parquet_path(name)
+        columns = self.USED_COLUMNS[name]
+        
+        if os.path.exists(parquet_path) and (
+            not os.path.exists(csv_path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+        ):
+            df = pq.read_table(parquet_path, columns=columns).to_pandas()
+        else:
+            df = _read_csv(csv_path, columns)
+        
+        df = df.astype({col: 'category' for col in self.CATEGORICAL_COLUMNS if col in df.columns})
+        narrow = {col: dtype for col, dtype in self.NARROW_INT_COLUMNS.items()
+                  if col in df.columns and not df[col].hasnans}
+        return df.astype(narrow) if narrow else df
         
     def load_raw_data(self) -> Dict[str, pd.DataFrame]:
         """
-        Load all raw CSV files into DataFrames.
+        Load the used columns of all raw datasets into DataFrames.
+        
+        The files are read on a thread pool; the CSV and Parquet readers release
+        the GIL while parsing, so reads of different files overlap.
         
         Returns:
             Dict[str, pd.DataFrame]: Dictionary containing all loaded datasets
         """
-        datasets = {
-            'orders': 'orders_dataset.csv',
-            'order_items': 'order_items_dataset.csv', 
-            'products': 'products_dataset.csv',
-            'customers': 'customers_dataset.csv',
-            'reviews': 'order_reviews_dataset.csv',
-            'payments': 'order_payments_dataset.csv'
-        }
-        
-        for name, filename in datasets.items():
-            filepath = f"{self.data_path}{filename}"
-            self.raw_data[name] = pd.read_csv(filepath)
-            print(f"Loaded {name}: {len(self.raw_data[name]):,} records")
+        with ThreadPoolExecutor(max_workers=len(self.DATASETS)) as executor:
+            futures = {
+                name: executor.submit(self._read_dataset, name, filename)
+                for name, filename in self.DATASETS.items()
+            }
+            for name, future in futures.items():
+                self.raw_data[name] = future.result()
+                print(f"Loaded {name}: {len(self.raw_data[name]):,} records")
             
         return self.raw_data
     
     def process_datetime_columns(self) -> None:
         """Convert string datetime columns to pandas datetime objects."""
-        datetime_columns = {
-            'orders': ['order_purchase_timestamp', 'order_approved_at', 
-                      'order_delivered_carrier_date', 'order_delivered_customer_date',
-                      'order_estimated_delivery_date'],
-            'reviews': ['review_creation_date', 'review_answer_timestamp']
-        }
-        
-        for dataset_name, columns in datetime_columns.items():
+        for dataset_name, columns in self.DATETIME_COLUMNS.items():
             if dataset_name in self.raw_data:
                 for col in columns:
                     if col in self.raw_data[dataset_name].columns:
-                        self.raw_data[dataset_name][col] = pd.to_datetime(
-                            self.raw_data[dataset_name][col], errors='coerce'
+                        self.raw_data[dataset_name][col] = _parse_timestamps(
+                            self.raw_data[dataset_name][col]
                         )
     
     def add_derived_columns(self) -> None:
         """Add useful derived columns for analysis."""
         if 'orders' in self.raw_data:
-            # Add year and month columns for filtering
-            orders_df = self.raw_data['orders'].copy()
-            orders_df['order_year'] = orders_df['order_purchase_timestamp'].dt.year
-            orders_df['order_month'] = orders_df['order_purchase_timestamp'].dt.month
-            orders_df['order_day'] = orders_df['order_purchase_timestamp'].dt.day
-            orders_df['order_weekday'] = orders_df['order_purchase_timestamp'].dt.day_name()
+            # Add year and month columns for filtering, and delivery time in days;
+            # assign builds the derived frame in one step without copying raw_data
+            orders_df = self.raw_data['orders']
+            purchased = orders_df['order_purchase_timestamp'].dt
+            order_year, order_month = purchased.year, purchased.month
+            if not order_year.hasnans:
+                order_year = order_year.astype(np.int16)
+                order_month = order_month.astype(np.int8)
             
-            # Calculate delivery time in days
-            orders_df['delivery_days'] = (
-                orders_df['order_delivered_customer_date'] - 
-                orders_df['order_purchase_timestamp']
-            ).dt.days
+            orders_df = orders_df.assign(
+                order_year=order_year,
+                order_month=order_month,
+                order_day=purchased.day,
+                order_weekday=purchased.day_name(),
+                delivery_days=_elapsed_days(
+                    orders_df['order_delivered_customer_date'],
+                    orders_df['order_purchase_timestamp']
+                )
+            )
             
             self.processed_data['orders'] = orders_df
+            self.available_years = sorted(int(year) for year in order_year.dropna().unique())
+            
+            # Sales columns of orders indexed and sorted by order_id, so that
+            # create_sales_dataset joins against a prebuilt index
+            self._orders_indexed = (
+                orders_df[self.SALES_ORDER_COLUMNS].set_index('order_id').sort_index()
+            )
+            
+            # Revenue and order counts per status and month, so trend charts
+            # slice a few dozen rows instead of aggregating the sales dataset
+            if 'order_items' in self.raw_data:
+                order_keys = self._orders_indexed[['order_status', 'order_year', 'order_month']]
+                self._monthly_revenue = (
+                    self.raw_data['order_items'][['order_id', 'price']]
+                    .join(order_keys, on='order_id', how='inner')
+                    .groupby(['order_status', 'order_year', 'order_month'], observed=True)
+                    .agg(revenue=('price', 'sum'), orders=('order_id', 'nunique'))
+                )
         
-        # Copy other datasets to processed_data
+        # Other datasets need no derived columns; processed_data is read-only,
+        # so it shares them with raw_data
         for name, df in self.raw_data.items():
             if name != 'orders':
-                self.processed_data[name] = df.copy()
+                self.processed_data[name] = df
     
     def create_sales_dataset(self, 
                            year_filter: Optional[Union[int, list]] = None,
@@ -111,32 +342,33 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Merged and filtered sales dataset
         """
-        # Get base datasets
-        orders = self.processed_data['orders'].copy()
-        order_items = self.processed_data['order_items'].copy()
+        # Project the columns the sales dataset needs; filtering and joining
+        # below create new frames, so the processed data is never mutated
+        orders = self._orders_indexed
+        if orders is None:
+            orders = self.processed_data['orders'][self.SALES_ORDER_COLUMNS].set_index('order_id')
+        order_items = self.processed_data['order_items'][self.SALES_ITEM_COLUMNS]
         
-        # Apply filters
+        # Apply filters as one combined mask, selecting the orders only once
+        mask = np.ones(len(orders), dtype=bool)
         if status_filter:
-            orders = orders[orders['order_status'] == status_filter]
+            mask &= (orders['order_status'] == status_filter).to_numpy()
             
         if year_filter is not None:
             if isinstance(year_filter, (int, np.integer)):
                 year_filter = [year_filter]
-            orders = orders[orders['order_year'].isin(year_filter)]
+            mask &= _matches_any(orders['order_year'].to_numpy(), year_filter)
             
         if month_filter is not None:
             if isinstance(month_filter, (int, np.integer)):
                 month_filter = [month_filter]
-            orders = orders[orders['order_month'].isin(month_filter)]
+            mask &= _matches_any(orders['order_month'].to_numpy(), month_filter)
         
-        # Merge datasets
-        sales_data = pd.merge(
-            left=order_items[['order_id', 'order_item_id', 'product_id', 'price', 'freight_value']],
-            right=orders[['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp',
-                         'order_delivered_customer_date', 'order_year', 'order_month', 'delivery_days']],
-            on='order_id',
-            how='inner'
-        )
+        if not mask.all():
+            orders = orders[mask]
+        
+        # Join order items to their orders on the order_id index
+        sales_data = order_items.join(orders, on='order_id', how='inner').reset_index(drop=True)
         
         print(f"Created sales dataset: {len(sales_data):,} records")
         if year_filter:
@@ -148,6 +380,21 @@ class EcommerceDataLoader:
             
         return sales_data
     
+    @cached_property
+    def products_df(self) -> pd.DataFrame:
+        """Product categories, projected once and shared; treat as read-only."""
+        return self.processed_data['products'][['product_id', 'product_category_name']]
+    
+    @cached_property
+    def customers_df(self) -> pd.DataFrame:
+        """Customer locations, projected once and shared; treat as read-only."""
+        return self.processed_data['customers'][['customer_id', 'customer_state', 'customer_city']]
+    
+    @cached_property
+    def reviews_df(self) -> pd.DataFrame:
+        """Review scores, projected once and shared; treat as read-only."""
+        return self.processed_data['reviews'][['order_id', 'review_score', 'review_creation_date']]
+    
     def get_product_categories(self) -> pd.DataFrame:
         """
         Get product category information merged with sales data.
@@ -155,7 +402,7 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Products dataset with category information
         """
-        return self.processed_data['products'][['product_id', 'product_category_name']].copy()
+        return self.products_df.copy()
     
     def get_customer_geography(self) -> pd.DataFrame:
         """
@@ -164,7 +411,7 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Customers dataset with location data
         """
-        return self.processed_data['customers'][['customer_id', 'customer_state', 'customer_city']].copy()
+        return self.customers_df.copy()
     
     def get_review_scores(self) -> pd.DataFrame:
         """
@@ -173,7 +420,19 @@ class EcommerceDataLoader:
         Returns:
             pd.DataFrame: Reviews dataset with scores and timestamps
         """
-        return self.processed_data['reviews'][['order_id', 'review_score', 'review_creation_date']].copy()
+        return self.reviews_df.copy()
+    
+    def get_monthly_revenue(self, status_filter: str = 'delivered') -> pd.DataFrame:
+        """
+        Get revenue and order counts per month for one order status.
+        
+        Args:
+            status_filter: Order status to select ('delivered', 'shipped', etc.)
+            
+        Returns:
+            pd.DataFrame: Revenue and orders indexed by order_year and order_month
+        """
+        return self._monthly_revenue.xs(status_filter, level='order_status')
     
     def process_all_data(self) -> Dict[str, pd.DataFrame]:
         """
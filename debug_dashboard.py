@@ -8,19 +8,19 @@ def debug_dashboard_data():
     print("=== DEBUGGING DASHBOARD DATA FLOW ===\n")
     
     try:
-        from data_loader import EcommerceDataLoader, load_and_process_data
+        from _cache import cached_load, cached_report
         from business_metrics import BusinessMetricsCalculator
         
         # 1. Test data loading
         print("1. Testing data loading...")
-        loader, processed_data = load_and_process_data('ecommerce_data/')
+        loader, processed_data = cached_load('ecommerce_data/')
         
         if processed_data is None:
             print("❌ Failed to load processed_data")
             return
             
-        # Check available years
-        available_years = sorted(processed_data['orders']['order_year'].dropna().unique())
+        # Check available years, as computed once by the loader for the dashboard
+        available_years = loader.available_years
         print(f"✅ Available years: {available_years}")
         
         # 2. Test sales data creation for current year
@@ -43,9 +43,9 @@ def debug_dashboard_data():
         
         # 3. Test supporting datasets
         print(f"\n3. Testing supporting datasets...")
-        products_df = loader.get_product_categories()
-        customers_df = loader.get_customer_geography()
-        reviews_df = loader.get_review_scores()
+        products_df = loader.products_df
+        customers_df = loader.customers_df
+        reviews_df = loader.reviews_df
         
         print(f"   Products: {len(products_df)} records")
         print(f"   Customers: {len(customers_df)} records")
@@ -67,7 +67,8 @@ def debug_dashboard_data():
         # 5. Test comprehensive report generation
         print(f"\n5. Testing comprehensive report...")
         try:
-            comprehensive_report = metrics_calculator.generate_comprehensive_report(
+            comprehensive_report = cached_report(
+                sales_data,
                 current_year=current_year,
                 previous_year=previous_year,
                 products_df=products_df,
@@ -3,54 +3,48 @@
 Test script for the Streamlit dashboard to verify all components work correctly.
 """
 
-def test_dashboard():
+def test_dashboard(loader):
     print('Testing Streamlit dashboard components...')
     
+    # Test imports
+    import streamlit
+    from _cache import cached_report
+    print('✅ All imports successful')
+    
+    # Test data loading
+    sales_data = loader.create_sales_dataset(year_filter=2023, status_filter='delivered')
+    print(f'✅ Data loaded: {len(sales_data):,} records')
+    
+    # Test supporting datasets
+    products_df = loader.products_df
+    customers_df = loader.customers_df
+    reviews_df = loader.reviews_df
+    print(f'✅ Supporting datasets: {len(products_df)}, {len(customers_df)}, {len(reviews_df)} records')
+    
+    # Test metrics calculation
+    comprehensive_report = cached_report(
+        sales_data,
+        current_year=2023,
+        previous_year=2022,
+        products_df=products_df,
+        customers_df=customers_df,
+        reviews_df=reviews_df
+    )
+    
+    revenue = comprehensive_report['revenue_metrics']['total_revenue']
+    print(f'✅ Comprehensive report generated: Revenue ${revenue:,.2f}')
+    
+    # Test chart creation functions
+    print('✅ All dashboard components ready')
+    print('✅ Dashboard ready to run with: streamlit run dashboard.py')
+
+if __name__ == "__main__":
+    from _cache import cached_load
+    loader, _ = cached_load('ecommerce_data/')
     try:
-        # Test imports
-        import streamlit
-        from data_loader import EcommerceDataLoader, load_and_process_data
-        from business_metrics import BusinessMetricsCalculator
-        import plotly.express as px
-        import plotly.graph_objects as go
-        print('✅ All imports successful')
-        
-        # Test data loading
-        loader, processed_data = load_and_process_data('ecommerce_data/')
-        sales_data = loader.create_sales_dataset(year_filter=2023, status_filter='delivered')
-        print(f'✅ Data loaded: {len(sales_data):,} records')
-        
-        # Test supporting datasets
-        products_df = loader.get_product_categories()
-        customers_df = loader.get_customer_geography()
-        reviews_df = loader.get_review_scores()
-        print(f'✅ Supporting datasets: {len(products_df)}, {len(customers_df)}, {len(reviews_df)} records')
-        
-        # Test metrics calculation
-        metrics_calculator = BusinessMetricsCalculator(sales_data)
-        comprehensive_report = metrics_calculator.generate_comprehensive_report(
-            current_year=2023,
-            previous_year=2022,
-            products_df=products_df,
-            customers_df=customers_df,
-            reviews_df=reviews_df
-        )
-        
-        revenue = comprehensive_report['revenue_metrics']['total_revenue']
-        print(f'✅ Comprehensive report generated: Revenue ${revenue:,.2f}')
-        
-        # Test chart creation functions
-        print('✅ All dashboard components ready')
-        print('✅ Dashboard ready to run with: streamlit run dashboard.py')
-        
-        return True
-        
+        test_dashboard(loader)
     except Exception as e:
         print(f'❌ Error: {e}')
         import traceback
         traceback.print_exc()
-        return False
-
-if __name__ == "__main__":
-    success = test_dashboard()
-    exit(0 if success else 1)
\ No newline at end of file
+        exit(1)
\ No newline at end of file
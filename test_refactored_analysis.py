@@ -7,11 +7,13 @@ to verify that the analysis works correctly with the existing data.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from data_loader import EcommerceDataLoader, load_and_process_data, get_data_summary
+from data_loader import get_data_summary
+from _cache import cached_load, cached_report
 from business_metrics import BusinessMetricsCalculator, MetricsVisualizer
 
-def test_refactored_analysis():
+DATA_PATH = 'ecommerce_data/'
+
+def test_refactored_analysis(loader):
     """Test the complete refactored analysis workflow"""
     
     # Analysis Configuration (matches notebook)
@@ -19,7 +21,6 @@ def test_refactored_analysis():
     COMPARISON_YEAR = 2022
     ANALYSIS_MONTH = None
     ORDER_STATUS = 'delivered'
-    DATA_PATH = 'ecommerce_data/'
     COLOR_PALETTE = 'viridis'
     
     print("=" * 60)
@@ -28,8 +29,7 @@ def test_refactored_analysis():
     
     # Step 1: Load and process data
     print("\n1. Loading and processing data...")
-    loader, processed_data = load_and_process_data(DATA_PATH)
-    get_data_summary(processed_data)
+    get_data_summary(loader.processed_data)
     
     # Step 2: Create analysis dataset
     print("\n2. Creating analysis dataset...")
@@ -39,9 +39,9 @@ def test_refactored_analysis():
         status_filter=ORDER_STATUS
     )
     
-    products_df = loader.get_product_categories()
-    customers_df = loader.get_customer_geography()
-    reviews_df = loader.get_review_scores()
+    products_df = loader.products_df
+    customers_df = loader.customers_df
+    reviews_df = loader.reviews_df
     
     print(f"Analysis dataset: {len(sales_data):,} records")
     print(f"Date range: {sales_data['order_purchase_timestamp'].min().date()} to {sales_data['order_purchase_timestamp'].max().date()}")
@@ -49,12 +49,14 @@ def test_refactored_analysis():
     # Step 3: Calculate business metrics
     print("\n3. Calculating business metrics...")
     metrics_calculator = BusinessMetricsCalculator(sales_data)
+    assert metrics_calculator.sales_data is sales_data, "loader dtypes should need no downcast copy"
     
     # Revenue metrics
     revenue_metrics = metrics_calculator.calculate_revenue_metrics(ANALYSIS_YEAR, COMPARISON_YEAR)
     
     # Comprehensive report
-    comprehensive_report = metrics_calculator.generate_comprehensive_report(
+    comprehensive_report = cached_report(
+        sales_data,
         current_year=ANALYSIS_YEAR,
         previous_year=COMPARISON_YEAR,
         products_df=products_df,
@@ -97,18 +99,22 @@ def test_refactored_analysis():
         if not passed:
             all_passed = False
     
-    return all_passed
+    assert all_passed, "Some results did not match the expected values"
 
 if __name__ == "__main__":
     try:
-        success = test_refactored_analysis()
+        loader, _ = cached_load(DATA_PATH)
+        test_refactored_analysis(loader)
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! EDA_Refactored.ipynb is ready to use.")
+        print("=" * 60)
+    except AssertionError:
         print("\n" + "=" * 60)
-        if success:
-            print("🎉 ALL TESTS PASSED! EDA_Refactored.ipynb is ready to use.")
-        else:
-            print("❌ Some tests failed. Please check the implementation.")
+        print("❌ Some tests failed. Please check the implementation.")
         print("=" * 60)
+        exit(1)
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+        exit(1)
\ No newline at end of file
@@ -5,16 +5,11 @@ Test individual dashboard components to identify rendering issues.
 
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from data_loader import EcommerceDataLoader, load_and_process_data
-from business_metrics import BusinessMetricsCalculator
+from _cache import cached_load, cached_report
 
-def test_dashboard_components():
+def test_dashboard_components(loader):
     print("=== TESTING INDIVIDUAL DASHBOARD COMPONENTS ===\n")
     
-    # Load data
-    loader, processed_data = load_and_process_data('ecommerce_data/')
     current_year = 2023
     previous_year = 2022
     
@@ -23,13 +18,12 @@ def test_dashboard_components():
         status_filter='delivered'
     )
     
-    products_df = loader.get_product_categories()
-    customers_df = loader.get_customer_geography()
-    reviews_df = loader.get_review_scores()
+    products_df = loader.products_df
+    customers_df = loader.customers_df
+    reviews_df = loader.reviews_df
     
-    metrics_calculator = BusinessMetricsCalculator(sales_data)
-    
-    comprehensive_report = metrics_calculator.generate_comprehensive_report(
+    comprehensive_report = cached_report(
+        sales_data,
         current_year=current_year,
         previous_year=previous_year,
         products_df=products_df,
@@ -80,12 +74,11 @@ def test_dashboard_components():
     # Test chart data preparation
     print("\n4. Testing chart data preparation...")
     
-    # Revenue trend data
-    current_data = sales_data[sales_data['order_year'] == current_year]
-    previous_data = sales_data[sales_data['order_year'] == previous_year]
+    # Revenue trend data, from the precomputed monthly revenue the dashboard uses
+    monthly_pivot = loader.get_monthly_revenue('delivered')['revenue'].unstack('order_year')
     
-    current_monthly = current_data.groupby('order_month')['price'].sum().reset_index()
-    previous_monthly = previous_data.groupby('order_month')['price'].sum().reset_index()
+    current_monthly = monthly_pivot[current_year].dropna()
+    previous_monthly = monthly_pivot[previous_year].dropna()
     
     print(f"   Current year monthly data: {len(current_monthly)} months")
     print(f"   Previous year monthly data: {len(previous_monthly)} months")
@@ -121,4 +114,5 @@ def test_dashboard_components():
     print("\n=== COMPONENT TESTING COMPLETE ===")
 
 if __name__ == "__main__":
-    test_dashboard_components()
\ No newline at end of file
+    loader, _ = cached_load('ecommerce_data/')
+    test_dashboard_components(loader)
\ No newline at end of file
@@ -9,7 +9,6 @@ def verify_dashboard():
     try:
         # Test imports
         print("1. Testing imports...")
-        import streamlit as st
         from dashboard import (
             load_data, format_number, format_percentage,
             create_revenue_trend_chart, create_category_chart,
@@ -36,10 +35,9 @@ def verify_dashboard():
         
         print("\n3. Testing data loading...")
         # This will use the cached data loader
-        from data_loader import load_and_process_data
-        from business_metrics import BusinessMetricsCalculator
+        from _cache import cached_load, cached_report
         
-        loader, processed_data = load_and_process_data('ecommerce_data/')
+        loader, processed_data = cached_load('ecommerce_data/')
         if processed_data is None:
             print("❌ Data loading failed")
             return False
@@ -58,12 +56,12 @@ def verify_dashboard():
         print("\n4. Testing chart functions...")
         
         # Test chart creation with actual data
-        products_df = loader.get_product_categories()
-        customers_df = loader.get_customer_geography()
-        reviews_df = loader.get_review_scores()
+        products_df = loader.products_df
+        customers_df = loader.customers_df
+        reviews_df = loader.reviews_df
         
-        metrics_calculator = BusinessMetricsCalculator(sales_data)
-        comprehensive_report = metrics_calculator.generate_comprehensive_report(
+        comprehensive_report = cached_report(
+            sales_data,
             current_year=2023,
             previous_year=2022,
             products_df=products_df,
@@ -72,19 +70,21 @@ def verify_dashboard():
         )
         
         # Test each chart function
-        revenue_chart = create_revenue_trend_chart(sales_data, 2023, 2022)
+        revenue_chart = create_revenue_trend_chart(loader.get_monthly_revenue(), 2023, 2022)
         print("✅ Revenue trend chart created")
         
         product_metrics = comprehensive_report['product_metrics']
-        category_chart = create_category_chart(product_metrics)
+        category_chart = create_category_chart(product_metrics['category_performance'])
         print("✅ Category chart created")
         
         geographic_metrics = comprehensive_report['geographic_metrics']
-        map_chart = create_choropleth_map(geographic_metrics)
+        map_chart = create_choropleth_map(geographic_metrics['state_performance'])
         print("✅ Choropleth map created")
         
         experience_metrics = comprehensive_report['customer_experience_metrics']
-        satisfaction_chart = create_satisfaction_delivery_chart(experience_metrics)
+        satisfaction_chart = create_satisfaction_delivery_chart(
+            experience_metrics['delivery_satisfaction_correlation']
+        )
         print("✅ Satisfaction chart created")
         
         print(f"\n=== DASHBOARD VERIFICATION COMPLETE ===")